@@ -1,15 +1,33 @@
 import os
+import functools
 import oracledb
 import psycopg
+import psycopg_pool
 import configparser
 import csv
 import re
 import uuid
-from openpyxl import Workbook, load_workbook
 from Executor.enums.file_types import FileType
 import logging
 import time
 
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_file, mtime_ns):
+    """Parses a config file once per (path, mtime); the mtime key invalidates the cache on edits."""
+    config = configparser.ConfigParser()
+    # read_file raises on a missing or unreadable file instead of silently returning an empty config
+    with open(config_file, 'r', encoding='utf-8') as file:
+        config.read_file(file)
+    return config
+
+def load_config(config_file):
+    """Returns the parsed config for a file, re-reading it only when the file has changed on disk.
+
+    Raises FileNotFoundError up front when the file is missing, rather than letting
+    ConfigParser.read swallow it and surface later as a KeyError on the section lookup.
+    """
+    return _parse_config(config_file, os.stat(config_file).st_mtime_ns)
+
 # Retry decorator with exponential backoff
 def retry(tries, delay=3, backoff=2, exceptions=(Exception,)):
     """
@@ -149,7 +167,10 @@ class GeneralConnection:
 class GeneralCursor:
     def execute(self, query, params=None):
         raise NotImplementedError("Subclass must implement this method")
-    
+
+    def executemany(self, query, seq_of_params):
+        raise NotImplementedError("Subclass must implement this method")
+
     def fetchall(self):
         raise NotImplementedError("Subclass must implement this method")
     
@@ -158,7 +179,10 @@ class GeneralCursor:
     
     def fetchone(self):
         raise NotImplementedError("Subclass must implement this method")
-    
+
+    def set_fetch_size(self, size):
+        raise NotImplementedError("Subclass must implement this method")
+
     @property
     def description(self):
         """Expose the description attribute from the underlying cursor."""
@@ -169,24 +193,37 @@ class PostgresConnection(GeneralConnection):
     def __init__(self):
         self.logger = logging.getLogger("Postgres")
         self.__connection = None
+        self.__pool = None
+        self.__pool_key = None
 
     def connect(self, config_file, environment):
-        """Establishes a connection to a PostgreSQL database using the provided config file and environment."""
+        """Establishes a connection to a PostgreSQL database using the provided config file and environment.
+
+        Connections are checked out of a small connection pool that is created on the first
+        connect, so reconnecting after a dropped connection skips the TCP/auth handshake.
+        """
         try:
-            config = configparser.ConfigParser()
-            config.read(config_file)
+            config = load_config(config_file)
             env_section = f'{environment}_postgres'
-            self.__connection = psycopg.connect(
-                host=config[env_section]['host'],
-                port=config[env_section]['port'],
-                user=config[env_section]['user'],
-                password=config[env_section]['password'],
-                dbname=config[env_section]['dbname'],
-                row_factory=UniqueDictRowFactory
-            )
+            if self.__pool is None or self.__pool_key != (config_file, environment):
+                conninfo = psycopg.conninfo.make_conninfo(
+                    host=config[env_section]['host'],
+                    port=config[env_section]['port'],
+                    user=config[env_section]['user'],
+                    password=config[env_section]['password'],
+                    dbname=config[env_section]['dbname']
+                )
+                self.__pool = psycopg_pool.ConnectionPool(
+                    conninfo,
+                    min_size=1,
+                    max_size=4,
+                    kwargs={'row_factory': UniqueDictRowFactory}
+                )
+                self.__pool_key = (config_file, environment)
+            self.__connection = self.__pool.getconn()
             self.logger.debug(f"Connected to PostgreSQL database: {config[env_section]['dbname']}")
 
-        except (psycopg.OperationalError, configparser.Error) as e:
+        except (psycopg.OperationalError, psycopg_pool.PoolTimeout, configparser.Error) as e:
             self.logger.error(f"Failed to connect to PostgreSQL: {str(e)}")
             raise
 
@@ -195,10 +232,10 @@ class PostgresConnection(GeneralConnection):
         return self.__connection.broken
 
     def close(self):
-        """Closes the PostgreSQL database connection."""
+        """Returns the PostgreSQL connection to the pool."""
         if self.__connection:
-            self.__connection.close()
-            self.logger.debug("PostgreSQL connection closed.")
+            self.__pool.putconn(self.__connection)
+            self.logger.debug("PostgreSQL connection returned to the pool.")
 
     def commit(self):
         """It just commits!"""
@@ -209,6 +246,26 @@ class PostgresConnection(GeneralConnection):
         if self.__connection:
             self.__connection.rollback()
 
+    def copy_query_to_csv(self, query, file_name):
+        """Streams a query's result set straight to a CSV file via server-side COPY.
+
+        Postgres formats the CSV on the server and ships raw bytes, so the
+        Python-level per-cell serialization of the generic save path is skipped.
+        """
+        try:
+            if not file_name.lower().endswith('.csv'):
+                file_name += '.csv'
+            with open(file_name, 'wb', buffering=1 << 20) as file:
+                with self.__connection.cursor() as cursor:
+                    with cursor.copy(f"COPY ({query}) TO STDOUT WITH (FORMAT CSV, HEADER)") as copy:
+                        for chunk in copy:
+                            file.write(chunk)
+            self.__connection.commit()
+            self.logger.debug(f"Query results copied to {file_name} as CSV.")
+        except (psycopg.Error, OSError) as e:
+            self.logger.error(f"Failed to COPY query results to CSV: {str(e)}")
+            raise
+
     def get_cursor(self, is_client_cursor = False):
         """Returns a generalized cursor object based on param for PostgreSQL."""
         try:
@@ -244,6 +301,15 @@ class PostgresCursor(GeneralCursor):
             self.logger.error(f"Failed to execute query on PostgreSQL: {str(e)}")
             raise
 
+    def executemany(self, query, seq_of_params):
+        """Executes a SQL statement once per parameter set in a single batched call."""
+        try:
+            self.__cursor.executemany(query, seq_of_params)
+            self.logger.debug("Executed batch statement on PostgreSQL.")
+        except psycopg.Error as e:
+            self.logger.error(f"Failed to execute batch statement on PostgreSQL: {str(e)}")
+            raise
+
     def fetchone(self):
         """Fetches one row from the query result."""
         return self.__cursor.fetchone()
@@ -256,6 +322,12 @@ class PostgresCursor(GeneralCursor):
         """Fetches a specific number of rows from the query result."""
         return self.__cursor.fetchmany(size)
 
+    def set_fetch_size(self, size):
+        """Sizes the cursor's row transfer buffer so each round trip carries about `size` rows."""
+        # Only server-side cursors expose itersize; client cursors already hold the full result set.
+        if hasattr(self.__cursor, 'itersize'):
+            self.__cursor.itersize = size
+
     @property
     def description(self):
         """Expose the description attribute from the underlying cursor."""
@@ -266,12 +338,17 @@ class OracleConnection(GeneralConnection):
     def __init__(self):
         self.logger = logging.getLogger("Oracle")
         self.__connection = None
+        self.__pool = None
+        self.__pool_key = None
 
     def connect(self, config_file, environment):
-        """Establishes a connection to an Oracle database using the provided config file and environment."""
+        """Establishes a connection to an Oracle database using the provided config file and environment.
+
+        Connections are acquired from a small session pool that is created on the first
+        connect, so reconnecting after a dropped connection skips the TCP/auth handshake.
+        """
         try:
-            config = configparser.ConfigParser()
-            config.read(config_file)
+            config = load_config(config_file)
             env_section = f'{environment}_oracle'
             if config[env_section].get('sid') is not None:
                 dsn = oracledb.makedsn(
@@ -287,11 +364,20 @@ class OracleConnection(GeneralConnection):
                 )
             else:
                 dsn = None
-            self.__connection = oracledb.connect(
-                user=config[env_section]['user'],
-                password=config[env_section]['password'],
-                dsn=dsn
-            )
+            if self.__pool is None or self.__pool_key != (config_file, environment):
+                self.__pool = oracledb.create_pool(
+                    user=config[env_section]['user'],
+                    password=config[env_section]['password'],
+                    dsn=dsn,
+                    min=1,
+                    max=4,
+                    increment=1,
+                    getmode=oracledb.POOL_GETMODE_WAIT,
+                    # Cache prepared statements on each pooled session so repeated queries skip the parse
+                    stmtcachesize=50
+                )
+                self.__pool_key = (config_file, environment)
+            self.__connection = self.__pool.acquire()
             self.logger.debug(f"Connected to Oracle database: {config[env_section]}")
 
         except (oracledb.DatabaseError, configparser.Error) as e:
@@ -304,10 +390,10 @@ class OracleConnection(GeneralConnection):
         return not self.__connection.is_healthy()
 
     def close(self):
-        """Closes the Oracle database connection."""
+        """Releases the Oracle connection back to the pool."""
         if self.__connection:
             self.__connection.close()
-            self.logger.debug("Oracle connection closed.")
+            self.logger.debug("Oracle connection released back to the pool.")
 
     def get_cursor(self, is_client_cursor = False):
         """Returns a generalized cursor object for Oracle."""
@@ -345,34 +431,55 @@ class OracleCursor(GeneralCursor):
         """Executes a SQL query using the Oracle cursor."""
         try:
             self.__cursor.execute(query, params or {})
+            # Build the dict row factory once per statement; queries without a result set have no description
+            if self.__cursor.description:
+                self.__apply_row_factory()
             self.logger.debug("Executed query on Oracle.")
 
         except oracledb.DatabaseError as e:
             self.logger.error(f"Failed to execute query on Oracle: {str(e)}")
             raise
 
+    def executemany(self, query, seq_of_params):
+        """Executes a SQL statement once per parameter set in a single batched call."""
+        try:
+            self.__cursor.executemany(query, seq_of_params)
+            self.logger.debug("Executed batch statement on Oracle.")
+
+        except oracledb.DatabaseError as e:
+            self.logger.error(f"Failed to execute batch statement on Oracle: {str(e)}")
+            raise
+
     def fetchone(self):
         """Fetches one row from the query result."""
-        self.__apply_row_factory()
         return self.__cursor.fetchone()
 
     def fetchall(self):
         """Fetches all rows from the query result."""
-        self.__apply_row_factory()
         return self.__cursor.fetchall()
 
     def fetchmany(self, size):
         """Fetches a specific number of rows from the query result."""
-        self.__apply_row_factory()
         return self.__cursor.fetchmany(size)
 
+    def set_fetch_size(self, size):
+        """Sizes the cursor's row transfer buffers so each round trip carries about `size` rows."""
+        self.__cursor.arraysize = size
+        # Prefetching one row beyond arraysize lets the driver detect the end of the result set
+        # without an extra empty round trip.
+        self.__cursor.prefetchrows = size + 1
+
     @property
     def description(self):
         """Expose the description attribute from the underlying cursor."""
         return self.__cursor.description
     
     def __apply_row_factory(self):
-        """Applies the row factory to format rows as dictionaries with column names as keys, handling duplicate column names."""
+        """Applies the row factory to format rows as dictionaries with column names as keys, handling duplicate column names.
+
+        Called once per execute; recomputing the unique column list on every fetch call would redo
+        the same work for each batch of a paginated result set.
+        """
         # Extract column names from cursor description
         columns = [col[0] for col in self.__cursor.description]
 
@@ -580,12 +687,12 @@ class SQLExecutor:
                 self.logger.error(f"The provided path '{folder_path}' is not a valid directory.")
                 return
 
-            # Loop through all files in the folder
-            for file_name in os.listdir(folder_path):
-                file_path = os.path.join(folder_path, file_name)
-                if os.path.isfile(file_path):
-                    # Execute each file and save the results
-                    self.execute_file_and_save(file_path, f"{result_save_path}{os.path.splitext(file_name)[0]}", result_file_type, batch_size, row_limit)
+            # Loop through all files in the folder; scandir entries carry the file type without an extra stat
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        # Execute each file and save the results
+                        self.execute_file_and_save(entry.path, f"{result_save_path}{os.path.splitext(entry.name)[0]}", result_file_type, batch_size, row_limit)
 
     def execute_query(self, query, params=None) -> None:
         """
@@ -601,6 +708,77 @@ class SQLExecutor:
         with self.__get_cursor(is_client_cursor=True) as cursor:
             cursor.execute(query, params)
 
+    def execute_many(self, query, seq_of_params) -> None:
+        """
+        Executes a SQL statement once for each parameter set using the driver's executemany.
+
+        Parameters:
+            query (str): The SQL statement to execute.
+            seq_of_params (list): A sequence of parameter tuples or dictionaries, one per execution.
+
+        Returns:
+            None
+        """
+        with self.__get_cursor(is_client_cursor=True) as cursor:
+            cursor.executemany(query, seq_of_params)
+
+    def fetch_all_by_query(self, query, params=None) -> list:
+        """
+        Executes a SELECT query and returns every row via a single driver-side fetchall.
+
+        Parameters:
+            query (str): The SQL query to execute.
+            params (dict, optional): Parameters for the SQL query. Defaults to None.
+
+        Returns:
+            list: All rows returned by the query.
+        """
+        try:
+            with self.__get_cursor(is_client_cursor=True) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+        finally:
+            self.__db_connection.commit()
+
+    def save_query_to_csv(self, query, result_file) -> None:
+        """
+        Saves a query's full result set to a CSV file, using the connection's
+        server-side COPY fast path when it offers one (Postgres) and falling back
+        to the generic fetch-and-save path otherwise (Oracle).
+
+        Parameters:
+            query (str): The SELECT query whose results should be saved.
+            result_file (str): The path of the CSV file to write.
+
+        Returns:
+            None
+        """
+        self.__ensure_directory_exists(result_file)
+        if hasattr(self.__db_connection, 'copy_query_to_csv'):
+            self.__db_connection.copy_query_to_csv(query, result_file)
+        else:
+            rows = self.fetch_all_by_query(query)
+            self.save_results(rows, result_file, FileType.CSV)
+
+    def execute_sql(self, sql_text) -> None:
+        """
+        Executes SQL queries from a string, where each query is separated by a semicolon.
+        Useful when the SQL text is already in memory, avoiding a re-read of the source file.
+
+        Parameters:
+            sql_text (str): The SQL text containing one or more queries.
+
+        Returns:
+            None
+        """
+        queries = SQLExecutor.get_queries_from_str(sql_text)
+        if not queries:
+            return
+        # One cursor serves the whole script; opening a cursor per statement is pure overhead
+        with self.__get_cursor(is_client_cursor=True) as cursor:
+            for query in queries:
+                cursor.execute(query)
+
     def execute_file(self, file_name) -> None:
         """
         Executes SQL queries from a file, where each query is separated by a semicolon.
@@ -613,11 +791,7 @@ class SQLExecutor:
         """
         try:
             with open(file_name, 'r', encoding="utf-8") as file:
-                queries = file.read().split(';')
-                queries = [query.strip() for query in queries if query.strip()]  # Clean empty queries
-                for query in queries:
-                    with self.__get_cursor(is_client_cursor=True) as cursor:
-                        cursor.execute(query)
+                self.execute_sql(file.read())
 
         except FileNotFoundError:
             self.logger.error(f"SQL file not found: {file_name}")
@@ -670,6 +844,8 @@ class SQLExecutor:
                 self.__db_connection.connect(self.__config_file, self.__environment)
             else:
                 with self.__get_cursor() as cursor:
+                    # Match the driver's transfer buffers to the page size so each batch is one round trip
+                    cursor.set_fetch_size(page_size)
                     cursor.execute(query, params)
                     rows = cursor.fetchmany(page_size)
                     while rows:
@@ -745,9 +921,15 @@ class SQLExecutor:
         Returns:
             str or list: A specific query as a string if index or Name is provided, or a list of queries otherwise.
         """
+        queries = list(SQLExecutor.__split_file_queries(file_name, os.stat(file_name).st_mtime_ns))
+        return SQLExecutor.__select_queries(queries, index=index, Name=Name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def __split_file_queries(file_name, mtime_ns):
+        """Reads and splits a SQL file once per (path, mtime); the mtime key invalidates the cache on edits."""
         with open(file_name, 'r', encoding="utf-8") as file:
-            file_contents = file.read()
-        return SQLExecutor.get_queries_from_str(query_str = file_contents, index = index, Name = Name)
+            return tuple(SQLExecutor.get_queries_from_str(file.read()))
 
     @staticmethod
     def get_queries_from_str(query_str, index=None, Name=None) -> str or list:
@@ -764,7 +946,11 @@ class SQLExecutor:
         """
         queries = query_str.split(';')
         queries = [query.strip() for query in queries if query.strip()]
+        return SQLExecutor.__select_queries(queries, index=index, Name=Name)
 
+    @staticmethod
+    def __select_queries(queries, index=None, Name=None):
+        """Returns a single query selected by index or Name, or the full list when neither is given."""
         if index is not None:
             # Return the query at the specified index if it exists
             if 0 <= index < len(queries):
@@ -861,11 +1047,12 @@ class SQLExecutor:
             if not file_name.lower().endswith('.csv'):
                 file_name += '.csv'
 
-            with open(file_name, 'a' if is_append else 'w', newline='',  encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=data[0].keys(), delimiter=delimiter)
+            with open(file_name, 'a' if is_append else 'w', newline='',  encoding='utf-8', buffering=1 << 20) as file:
+                fieldnames = list(data[0].keys())
+                writer = csv.writer(file, delimiter=delimiter)
                 if include_header:
-                    writer.writeheader()
-                writer.writerows(data)
+                    writer.writerow(fieldnames)
+                writer.writerows([row[field] for field in fieldnames] for row in data)
             self.logger.debug(f"Data saved to {file_name} as CSV.")
         except Exception as e:
             self.logger.error(f"Failed to save data to CSV: {str(e)}")
@@ -895,9 +1082,10 @@ class SQLExecutor:
             if not file_name.lower().endswith('.csv'):
                 file_name += '.csv'
 
-            with open(file_name, 'a' if is_append else 'w', newline='', encoding='utf-8') as file:
+            with open(file_name, 'a' if is_append else 'w', newline='', encoding='utf-8', buffering=1 << 20) as file:
                 rows_fetched = 0
-                batch_index = 0 
+                batch_index = 0
+                writer = None
                 for i, batch in enumerate(all_batches):
                     if not batch:  # Skip empty batches
                         continue
@@ -906,18 +1094,19 @@ class SQLExecutor:
                         remaining_rows = apply_limit - rows_fetched
                         if remaining_rows < apply_batch_size:
                             batch = batch[:remaining_rows]
-            
+
                     if isinstance(batch, dict):  # If data is a single dictionary, wrap it in a list
                         batch = [batch]
 
-                    # Determine if the header should be included for this batch
-                    write_header = include_header and not i > 0
+                    # Create the writer on the first batch and include the header only there
+                    if writer is None:
+                        fieldnames = list(batch[0].keys())
+                        writer = csv.writer(file, delimiter=delimiter)
+                        if include_header and not i > 0:
+                            writer.writerow(fieldnames)
 
                     # Write all rows to the CSV file
-                    writer = csv.DictWriter(file, fieldnames=batch[0].keys(), delimiter=delimiter)
-                    if write_header:
-                        writer.writeheader()
-                    writer.writerows(batch)
+                    writer.writerows([row[field] for field in fieldnames] for row in batch)
 
                     rows_fetched += len(batch)
                     batch_index += 1
@@ -943,7 +1132,7 @@ class SQLExecutor:
             if not file_name.lower().endswith('.txt'):
                 file_name += '.txt'
 
-            with open(file_name, 'a' if is_append else 'w', newline='') as file:
+            with open(file_name, 'a' if is_append else 'w', newline='', buffering=1 << 20) as file:
                 # Writing headers
                 if include_header:
                     file.write('\t'.join(data[0].keys()) + '\n')
@@ -957,6 +1146,8 @@ class SQLExecutor:
 
     def __save_to_excel(self, data, file_name, is_append=False, include_header=True):
         """Saves data to an Excel file with column names."""
+        # Imported lazily so CSV/TXT-only callers never pay openpyxl's import cost
+        from openpyxl import Workbook, load_workbook
         try:
             if not data:  # Check if data is empty
                 self.logger.warning(f"No data to save to {file_name}. The file will not be created.")
@@ -968,15 +1159,13 @@ class SQLExecutor:
             if isinstance(data, dict):  # If data is a single dictionary, wrap it in a list
                 data = [data]
 
-            wb = None
-            if is_append:
-                try:
-                    wb = load_workbook(file_name)
-                except FileNotFoundError:
-                    wb = Workbook()
+            if is_append and os.path.exists(file_name):
+                wb = load_workbook(file_name)
+                ws = wb.active
             else:
-                wb = Workbook()
-            ws = wb.active
+                # Write-only mode streams rows straight to disk instead of building the whole sheet in memory
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet("Sheet1")
             # Writing headers
             if include_header:
                 ws.append(list(data[0].keys()))
@@ -1003,6 +1192,8 @@ class SQLExecutor:
         Returns:
             None
         """
+        # Imported lazily so CSV/TXT-only callers never pay openpyxl's import cost
+        from openpyxl import Workbook, load_workbook
         try:
             if not file_name.lower().endswith('.xlsx'):
                 file_name += '.xlsx'
@@ -1010,14 +1201,17 @@ class SQLExecutor:
             # Load existing workbook or create a new one
             if is_append and os.path.exists(file_name):
                 wb = load_workbook(file_name)
-            else:
-                wb = Workbook()
                 ws = wb.active
-                ws.title = "Sheet1"
+                # Only a sheet that is still empty needs the header row
+                write_header = include_header and ws.max_row == 1
+            else:
+                # Write-only mode streams rows straight to disk instead of building the whole sheet in memory
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet("Sheet1")
+                write_header = include_header
 
-            ws = wb.active
-            rows_fetched = 0 
-            batch_index = 0 
+            rows_fetched = 0
+            batch_index = 0
 
             for batch in batches:
                 if not batch:
@@ -1028,9 +1222,10 @@ class SQLExecutor:
                     if remaining_rows < apply_batch_size:
                         batch = batch[:remaining_rows]
 
-                # Write headers if this is the first row of a new sheet
-                if include_header and ws.max_row == 1:
+                # Write headers before the first batch; write-only sheets have no max_row to probe
+                if write_header:
                     ws.append(list(batch[0].keys()))
+                    write_header = False
 
                 # Write all rows in the batch at once
                 for row in batch:
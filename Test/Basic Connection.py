@@ -16,5 +16,4 @@ database = SQLExecutor(OracleConnection(), config_file=config_file, environment=
 batches = database.get_batches_by_query(query, page_size=3)
 for i, batch in enumerate(batches):
     print(batch)
-    # database.save_to_csv(batch, 'test', is_append= True if i!=0 else False, include_header=True if i==0 else False)
 
@@ -2,9 +2,12 @@ import itertools
 import threading
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os,sys, shutil
+import tempfile
 import csv
-import configparser 
+import configparser
+from pathlib import Path
 from openpyxl import load_workbook
 
 # Get the parent directory
@@ -16,6 +19,44 @@ from Executor.enums.file_types import FileType
 
 class TestSQLExecutorIntegration(unittest.TestCase):
 
+    # SQL fixture files created for each test run, keyed by path relative to the temp root.
+    SQL_FIXTURES = {
+        'SQL Files/singleQuery.sql': 'SELECT * FROM TestActors',
+        'SQL Files/multipleQueries.sql': '''SELECT * FROM TestActors;
+                        /*
+                            This query is just for testing purposes
+                        */
+                        /* PAGINATE SIZE 3 */
+                        SELECT * FROM TestActors;
+                        /* This is a test query */
+                        SELECT * FROM TestActors
+                        WHERE "PK_ID" = 5;
+                            ''',
+        'SQL Files/multipleQueries_with_params.sql': '''SELECT * FROM TestActors;
+                        /*
+                            This query is just for testing purposes
+                        */
+                        /* PAGINATE SIZE 3 */
+                        /* ROW LIMIT 6 */
+                        SELECT * FROM TestActors;
+                        /* This is a test query */
+                        SELECT * FROM TestActors
+                        WHERE "PK_ID" IN (3,4,5);
+                            ''',
+        'TestScripts/Adarsh.sql': '''SELECT * FROM TestActors;
+                        /*
+                            This query is just for testing purposes
+                        */
+                        /* PAGINATE SIZE 2 */
+                        SELECT * FROM TestActors;
+                            ''',
+        'TestScripts/Blake.sql': '''/* This is a test query */
+                        SELECT * FROM TestActors
+                        WHERE "PK_ID" IN (3,4,5);
+                        SELECT * FROM TestActors;
+                            ''',
+    }
+
     @classmethod
     def setUpClass(cls):
         """Common Setup for initializing and testing databases."""
@@ -62,55 +103,24 @@ class TestSQLExecutorIntegration(unittest.TestCase):
             except Exception as e:
                 cls.logger.error(f"Failed to connect to {db_type} database: {e}")
         
-        os.mkdir('./Test/TestFiles')
-        os.mkdir('./Test/TestFiles/oracle')
-        os.mkdir('./Test/TestFiles/postgres')
-        os.mkdir('./Test/SQL Files')
-        os.mkdir('./Test/TestScripts')
+        # Generated files live under a per-run temp directory (usually tmpfs), so
+        # concurrent runs cannot collide on a shared output folder inside the repo.
+        cls.temp_root = tempfile.mkdtemp(prefix='sqlexecutor_test_')
+        cls.files_dir = os.path.join(cls.temp_root, 'TestFiles')
+        cls.sql_files_dir = os.path.join(cls.temp_root, 'SQL Files')
+        cls.scripts_dir = os.path.join(cls.temp_root, 'TestScripts')
+        for path in (os.path.join(cls.files_dir, 'oracle'),
+                     os.path.join(cls.files_dir, 'postgres'),
+                     cls.sql_files_dir,
+                     cls.scripts_dir):
+            os.makedirs(path, exist_ok=True)
 
         # Create necessary SQL files for testing
         cls.logger.info("Creating test SQL files...")
 
         try:
-            with open('./Test/SQL Files/singleQuery.sql', 'w') as file:
-                    file.write('SELECT * FROM TestActors')
-            with open('./Test/SQL Files/multipleQueries.sql', 'w') as file:
-                file.write('''SELECT * FROM TestActors;
-                        /* 
-                            This query is just for testing purposes
-                        */
-                        /* PAGINATE SIZE 3 */
-                        SELECT * FROM TestActors;
-                        /* This is a test query */
-                        SELECT * FROM TestActors
-                        WHERE "PK_ID" = 5;
-                            ''')
-            with open('./Test/SQL Files/multipleQueries_with_params.sql', 'w') as file:
-                file.write('''SELECT * FROM TestActors;
-                        /* 
-                            This query is just for testing purposes
-                        */
-                        /* PAGINATE SIZE 3 */
-                        /* ROW LIMIT 6 */
-                        SELECT * FROM TestActors;
-                        /* This is a test query */
-                        SELECT * FROM TestActors
-                        WHERE "PK_ID" IN (3,4,5);
-                            ''')
-            with open('./Test/TestScripts/Adarsh.sql', 'w') as file:
-                file.write('''SELECT * FROM TestActors;
-                        /* 
-                            This query is just for testing purposes
-                        */
-                        /* PAGINATE SIZE 2 */
-                        SELECT * FROM TestActors;
-                            ''')
-            with open('./Test/TestScripts/Blake.sql', 'w') as file:
-                file.write('''/* This is a test query */
-                        SELECT * FROM TestActors
-                        WHERE "PK_ID" IN (3,4,5);
-                        SELECT * FROM TestActors;
-                            ''')
+            for rel_path, body in cls.SQL_FIXTURES.items():
+                Path(cls.temp_root, rel_path).write_text(body)
             cls.logger.info("Test SQL files created successfully.")
         except Exception as e:
             cls.logger.error(f"Error creating test SQL files: {e}")
@@ -121,29 +131,23 @@ class TestSQLExecutorIntegration(unittest.TestCase):
         cls.logger.info("Setting up Oracle database...")
         try:
             with db.transaction():
-                db.execute_query("""
-                BEGIN
-                EXECUTE IMMEDIATE 'DROP TABLE TestActors CASCADE CONSTRAINTS';
-                EXCEPTION
-                WHEN OTHERS THEN
-                    IF SQLCODE != -942 THEN
-                        RAISE;
-                    END IF;
-                END;
-                """)
-                db.execute_query("""
-                    CREATE TABLE TestActors (
-                        PK_ID INTEGER PRIMARY KEY,
-                        NAME VARCHAR(100),
-                        SEX VARCHAR(10),
-                        BIO VARCHAR(1000)
-                    )
-                """)
-                for i in range(1, 11):
-                    db.execute_query(f"""
-                        INSERT INTO TestActors (PK_ID, NAME, SEX, BIO)
-                        VALUES ({i}, 'Actor {i}', 'Male', 'Bio of Actor {i}')
+                # Probe user_tables with a cheap SELECT instead of compiling a PL/SQL block server-side.
+                # Reuse the table across runs: TRUNCATE skips the expensive DROP/CREATE DDL path.
+                if db.fetch_all_by_query("SELECT 1 FROM user_tables WHERE table_name = 'TESTACTORS'"):
+                    db.execute_query("TRUNCATE TABLE TestActors")
+                else:
+                    db.execute_query("""
+                        CREATE TABLE TestActors (
+                            PK_ID INTEGER PRIMARY KEY,
+                            NAME VARCHAR(100),
+                            SEX VARCHAR(10),
+                            BIO VARCHAR(1000)
+                        )
                     """)
+                db.execute_many("""
+                    INSERT INTO TestActors (PK_ID, NAME, SEX, BIO)
+                    VALUES (:1, :2, :3, :4)
+                """, [(i, f'Actor {i}', 'Male', f'Bio of Actor {i}') for i in range(1, 11)])
             cls.logger.info("Oracle database setup completed.")
         except Exception as e:
             cls.logger.error(f"Error setting up Oracle database: {e}")
@@ -154,111 +158,130 @@ class TestSQLExecutorIntegration(unittest.TestCase):
         cls.logger.info("Setting up Postgres database...")
         try:
             with db.transaction():
-                db.execute_query("DROP TABLE IF EXISTS TestActors CASCADE;")
-                db.execute_query("""
-                    CREATE TABLE TestActors (
-                        "PK_ID" SERIAL PRIMARY KEY,
-                        "NAME" VARCHAR(100),
-                        "SEX" VARCHAR(10),
-                        "BIO" TEXT
-                    )
-                """)
-
-                for i in range(1, 11):
-                    db.execute_query(f"""
-                        INSERT INTO TestActors ("NAME", "SEX", "BIO")
-                        VALUES ('Actor {i}', 'Male', 'Bio of Actor {i}')
+                # Reuse the table across runs: TRUNCATE skips the expensive DROP/CREATE DDL path.
+                if db.fetch_all_by_query("SELECT 1 FROM information_schema.tables WHERE table_name = 'testactors'"):
+                    db.execute_query("TRUNCATE TABLE TestActors RESTART IDENTITY CASCADE")
+                else:
+                    db.execute_query("""
+                        CREATE TABLE TestActors (
+                            "PK_ID" SERIAL PRIMARY KEY,
+                            "NAME" VARCHAR(100),
+                            "SEX" VARCHAR(10),
+                            "BIO" TEXT
+                        )
                     """)
+
+                db.execute_many("""
+                    INSERT INTO TestActors ("NAME", "SEX", "BIO")
+                    VALUES (%s, %s, %s)
+                """, [(f'Actor {i}', 'Male', f'Bio of Actor {i}') for i in range(1, 11)])
                 cls.logger.info("Postgres database setup completed.")
         except Exception as e:
             cls.logger.error(f"Error setting up Postgres database: {e}")
 
 
+    def run_for_all_databases(self, worker):
+        """Helper method to run a per-DB test body against all configured databases concurrently."""
+        if not self.databases:
+            return
+        with ThreadPoolExecutor(max_workers=len(self.databases)) as executor:
+            futures = [executor.submit(worker, db_type, db) for db_type, db in self.databases.items()]
+            for future in as_completed(futures):
+                future.result()
+
     def test_fetchAll_save_to_files(self):
         """Test Database features: save to CSV, TXT, Excel."""
-        output_dir = './Test/TestFiles'
-        for db_type, db in self.databases.items():
+        output_dir = self.files_dir
+        def run_for_db(db_type, db):
             with self.subTest(db=db_type):
                 self.logger.info(f"Running fetchAll test for {db_type} database.")
+                base_path = os.path.join(output_dir, f'{db_type}_fetchAll_test')
                 try:
-                    db.execute_file_and_save(file_name='./Test/SQL Files/singleQuery.sql',result_file_path=os.path.join(output_dir, f'{db_type}_fetchAll_test'),result_file_type=FileType.CSV)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/singleQuery.sql',result_file_path=os.path.join(output_dir, f'{db_type}_fetchAll_test'),result_file_type=FileType.TXT)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/singleQuery.sql',result_file_path=os.path.join(output_dir, f'{db_type}_fetchAll_test'),result_file_type=FileType.EXCEL)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'singleQuery.sql'),result_file_path=base_path,result_file_type=FileType.CSV)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'singleQuery.sql'),result_file_path=base_path,result_file_type=FileType.TXT)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'singleQuery.sql'),result_file_path=base_path,result_file_type=FileType.EXCEL)
                     self.verify_files(self.testActors_data, db_type, 'fetchAll')
                 except Exception as e:
                     self.logger.error(f"Error in fetchAll test for {db_type}: {e}")
                     raise
+        self.run_for_all_databases(run_for_db)
 
     def test_fetchOne_save_to_files(self):
         """Test fetching one record from both databases and saving to CSV, TXT, Excel."""
-        output_dir = './Test/TestFiles'
-        for db_type, db in self.databases.items():
+        output_dir = self.files_dir
+        def run_for_db(db_type, db):
             with self.subTest(db=db_type):
                 self.logger.info(f"Running fetchOne test for {db_type} database.")
+                base_path = os.path.join(output_dir, f'{db_type}_fetchOne_test')
                 try:
-                    db.execute_file_and_save(file_name='./Test/SQL Files/singleQuery.sql',result_file_path=os.path.join(output_dir, f'{db_type}_fetchOne_test'),result_file_type=FileType.CSV, batch_size=1)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/singleQuery.sql',result_file_path=os.path.join(output_dir, f'{db_type}_fetchOne_test'),result_file_type=FileType.TXT, batch_size=1)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/singleQuery.sql',result_file_path=os.path.join(output_dir, f'{db_type}_fetchOne_test'),result_file_type=FileType.EXCEL, batch_size=1)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'singleQuery.sql'),result_file_path=base_path,result_file_type=FileType.CSV, batch_size=1)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'singleQuery.sql'),result_file_path=base_path,result_file_type=FileType.TXT, batch_size=1)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'singleQuery.sql'),result_file_path=base_path,result_file_type=FileType.EXCEL, batch_size=1)
                     self.verify_files(self.testActors_data, db_type, 'fetchOne')
                 except Exception as e:
                     self.logger.error(f"Error in fetchOne test for {db_type}: {e}")
                     raise
+        self.run_for_all_databases(run_for_db)
 
     def test_fetchMany_save_to_files(self):
         """Test fetching multiple records from both databases and saving to CSV, TXT, Excel."""
-        output_dir = './Test/TestFiles'
-        for db_type, db in self.databases.items():
+        output_dir = self.files_dir
+        def run_for_db(db_type, db):
             with self.subTest(db=db_type):
                 self.logger.info(f"Running fetchMany test for {db_type} database.")
+                base_path = os.path.join(output_dir, f'{db_type}_fetchMany_test')
                 try:
-                    db.execute_file_and_save(file_name='./Test/SQL Files/singleQuery.sql',result_file_path=os.path.join(output_dir, f'{db_type}_fetchMany_test'),result_file_type=FileType.CSV, batch_size=3)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/singleQuery.sql',result_file_path=os.path.join(output_dir, f'{db_type}_fetchMany_test'),result_file_type=FileType.TXT, batch_size=3)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/singleQuery.sql',result_file_path=os.path.join(output_dir, f'{db_type}_fetchMany_test'),result_file_type=FileType.EXCEL, batch_size=3)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'singleQuery.sql'),result_file_path=base_path,result_file_type=FileType.CSV, batch_size=3)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'singleQuery.sql'),result_file_path=base_path,result_file_type=FileType.TXT, batch_size=3)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'singleQuery.sql'),result_file_path=base_path,result_file_type=FileType.EXCEL, batch_size=3)
                     self.verify_files(self.testActors_data, db_type, 'fetchMany')
                 except Exception as e:
                     self.logger.error(f"Error in fetchMany test for {db_type}: {e}")
                     raise
+        self.run_for_all_databases(run_for_db)
 
     def test_multiquery_to_file(self):
         """Test fetching multiple queries from single file from both databases and saving to CSV, TXT, Excel."""
         list_data =[self.testActors_data, self.testActors_data, [self.testActors_data[4]]]
-        for db_type, db in self.databases.items():
-            output_path = f'./Test/TestFiles/{db_type}_test'
+        def run_for_db(db_type, db):
+            output_path = os.path.join(self.files_dir, f'{db_type}_test')
             with self.subTest(db=db_type):
                 self.logger.info(f"Running multi-query test for {db_type} database.")
                 try:
-                    db.execute_file_and_save(file_name='./Test/SQL Files/multipleQueries.sql', result_file_path=output_path, result_file_type=FileType.CSV)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/multipleQueries.sql', result_file_path=output_path, result_file_type=FileType.TXT)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/multipleQueries.sql', result_file_path=output_path, result_file_type=FileType.EXCEL)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'multipleQueries.sql'), result_file_path=output_path, result_file_type=FileType.CSV)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'multipleQueries.sql'), result_file_path=output_path, result_file_type=FileType.TXT)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'multipleQueries.sql'), result_file_path=output_path, result_file_type=FileType.EXCEL)
                     self.verify_multiQuery_files(db_type, list_data, 'test')
                 except Exception as e:
                     self.logger.error(f"Error in multi-query test for {db_type}: {e}")
                     raise
+        self.run_for_all_databases(run_for_db)
 
     def test_multiquery_with_params_to_file(self):
         """Test fetching multiple queries from single file from both databases and saving to CSV, TXT, Excel."""
         list_data =[self.testActors_data[:5], self.testActors_data[:6], self.testActors_data[2:5]]
-        for db_type, db in self.databases.items():
-            output_path = f'./Test/TestFiles/{db_type}_test_params'
+        def run_for_db(db_type, db):
+            output_path = os.path.join(self.files_dir, f'{db_type}_test_params')
             with self.subTest(db=db_type):
                 self.logger.info(f"Running multi-query test for {db_type} database.")
                 try:
-                    db.execute_file_and_save(file_name='./Test/SQL Files/multipleQueries_with_params.sql', result_file_path=output_path, result_file_type=FileType.CSV, row_limit=5, batch_size=2)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/multipleQueries_with_params.sql', result_file_path=output_path, result_file_type=FileType.TXT, row_limit=5, batch_size=2)
-                    db.execute_file_and_save(file_name='./Test/SQL Files/multipleQueries_with_params.sql', result_file_path=output_path, result_file_type=FileType.EXCEL, row_limit=5, batch_size=2)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'multipleQueries_with_params.sql'), result_file_path=output_path, result_file_type=FileType.CSV, row_limit=5, batch_size=2)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'multipleQueries_with_params.sql'), result_file_path=output_path, result_file_type=FileType.TXT, row_limit=5, batch_size=2)
+                    db.execute_file_and_save(file_name=os.path.join(self.sql_files_dir, 'multipleQueries_with_params.sql'), result_file_path=output_path, result_file_type=FileType.EXCEL, row_limit=5, batch_size=2)
                     self.verify_multiQuery_files(db_type, list_data, 'test_params')
                 except Exception as e:
                     self.logger.error(f"Error in multi-query test for {db_type}: {e}")
                     raise
+        self.run_for_all_databases(run_for_db)
 
     def test_folder_to_file_and_verify_files(self):
         """Test fetching multiple files from folder from both databases and saving to CSV, TXT, Excel."""
-        folder_path = './Test/TestScripts'
+        folder_path = self.scripts_dir
         adarsh_file_data = [self.testActors_data, self.testActors_data]
         blake_file_data = [self.testActors_data[2:5], self.testActors_data]
         final_data = {'Adarsh':adarsh_file_data, 'Blake': blake_file_data}
-        for db_type, db in self.databases.items():
-            result_save_path = f'./Test/TestFiles/{db_type}/'
+        def run_for_db(db_type, db):
+            result_save_path = os.path.join(self.files_dir, db_type) + os.sep
             with self.subTest(db=db_type):
                 self.logger.info(f"Running folder query test for {db_type} database.")
                 try:
@@ -266,7 +289,7 @@ class TestSQLExecutorIntegration(unittest.TestCase):
                     if not os.path.isdir(folder_path):
                         self.logger.warning(f"Directory {folder_path} does not exist.")
                         return
-                    
+
                     db.execute_folder_and_save(folder_path, result_save_path , result_file_type=FileType.CSV)
                     db.execute_folder_and_save(folder_path, result_save_path, result_file_type=FileType.TXT)
                     db.execute_folder_and_save(folder_path, result_save_path, result_file_type=FileType.EXCEL)
@@ -274,22 +297,28 @@ class TestSQLExecutorIntegration(unittest.TestCase):
                 except Exception as e:
                     self.logger.error(f"Error in folder query test for {db_type}: {e}")
                     raise
+        self.run_for_all_databases(run_for_db)
+
+    # Per-database rollback scenarios: an insert that must not survive and a statement that must fail.
+    ROLLBACK_SCENARIOS = {
+        'postgres': ("INSERT INTO TestActors (\"PK_ID\", \"NAME\", \"SEX\", \"BIO\") VALUES (900, 'Actor 900', 'Male', 'Should be rolled back')",
+                     "SELECT 1/0 AS db_exception"),
+        'oracle': ("INSERT INTO TestActors (PK_ID, NAME, SEX, BIO) VALUES (900, 'Actor 900', 'Male', 'Should be rolled back')",
+                   "SELECT 1/0 AS db_exception FROM dual"),
+    }
 
     def test_transaction_rollback_on_error(self):
         """Test that a transaction rolls back on error, specifically on a division by zero error."""
         for db_type, db in self.databases.items():
+            insert_sql, failing_sql = self.ROLLBACK_SCENARIOS[db_type]
             with self.subTest(db=db_type):
                 self.logger.info(f"Running transaction rollback test for {db_type} database.")
-                
+
                 try:
                     # Start a transaction
                     with db.transaction():
-                        if db_type == 'postgres':
-                            db.execute_query("INSERT INTO TestActors (\"PK_ID\", \"NAME\", \"SEX\", \"BIO\") VALUES (900, 'Actor 900', 'Male', 'Should be rolled back')")
-                            db.execute_query("SELECT 1/0 AS db_exception")
-                        elif db_type == 'oracle':
-                            db.execute_query("INSERT INTO TestActors (PK_ID, NAME, SEX, BIO) VALUES (900, 'Actor 900', 'Male', 'Should be rolled back')")
-                            db.execute_query("SELECT 1/0 AS db_exception FROM dual")
+                        db.execute_query(insert_sql)
+                        db.execute_query(failing_sql)
 
                     # If no exception was raised, fail the test
                     self.fail(f"Expected division by zero exception in {db_type} did not occur.")
@@ -299,9 +328,8 @@ class TestSQLExecutorIntegration(unittest.TestCase):
                     self.logger.info(f"Division by zero error occurred as expected in {db_type}: {e}")
 
                     # Now check that the insert was rolled back
-                    batches = db.get_batches_by_query("SELECT * FROM TestActors WHERE \"PK_ID\" = 900", page_size = 1)
-                    rows = [row for row in itertools.chain.from_iterable(batches)]
-                    self.assertEqual(len(rows), 0, f"Transaction did not roll back in {db_type}; found row with PK_ID 900.")
+                    rows = db.fetch_all_by_query("SELECT 1 FROM TestActors WHERE \"PK_ID\" = 900")
+                    self.assertFalse(rows, f"Transaction did not roll back in {db_type}; found row with PK_ID 900.")
 
                 else:
                     # If no exception was caught, this means the transaction did not rollback as expected
@@ -382,90 +410,102 @@ class TestSQLExecutorIntegration(unittest.TestCase):
     
 
 
+    def get_verifiers(self):
+        """Helper method returning (extension, verifier) pairs for each supported output format."""
+        return (('csv', self.verify_csv_content),
+                ('txt', self.verify_txt_content),
+                ('xlsx', self.verify_excel_content))
+
+    @staticmethod
+    def normalize_expected(data):
+        """Helper method to stringify expected rows once per format: CSV/Excel render None as '', TXT as 'None'."""
+        as_empty = [{key: '' if value is None else str(value) for key, value in row.items()} for row in data]
+        as_none = [{key: str(value) for key, value in row.items()} for row in data]
+        return {'csv': as_empty, 'txt': as_none, 'xlsx': as_empty}
+
     def verify_multiQuery_files(self, db_type, list_data, file_name):
         """Helper method to save multiquery data and verify CSV, TXT, Excel files."""
-        output_dir = './Test/TestFiles/'
-        
-        for i, data in enumerate(list_data):
-            # Check if files exist
-            self.assertTrue(os.path.exists(os.path.join(output_dir, f'{db_type}_{file_name}_{i+1}.csv')))
-            self.assertTrue(os.path.exists(os.path.join(output_dir, f'{db_type}_{file_name}_{i+1}.txt')))
-            self.assertTrue(os.path.exists(os.path.join(output_dir, f'{db_type}_{file_name}_{i+1}.xlsx')))
+        output_dir = self.files_dir
 
-            # Verify file contents
-            self.verify_csv_content(os.path.join(output_dir, f'{db_type}_{file_name}_{i+1}.csv'), data)
-            self.verify_txt_content(os.path.join(output_dir, f'{db_type}_{file_name}_{i+1}.txt'), data)
-            self.verify_excel_content(os.path.join(output_dir, f'{db_type}_{file_name}_{i+1}.xlsx'), data)
+        for i, data in enumerate(list_data):
+            # Verify file contents; each verifier's open raises FileNotFoundError for a missing file
+            expected = self.normalize_expected(data)
+            base = os.path.join(output_dir, f'{db_type}_{file_name}_{i+1}')
+            for ext, verify in self.get_verifiers():
+                verify(f'{base}.{ext}', expected[ext])
 
     def verify_folder_files(self, db_type, final_data):
         """Helper method to save multiquery data and verify CSV, TXT, Excel files."""
-        output_dir = f'./Test/TestFiles/{db_type}/'
+        output_dir = os.path.join(self.files_dir, db_type)
 
         for file_name, value in final_data.items():
             for i, data in enumerate(value):
-                # # Check if files exist
-                self.assertTrue(os.path.exists(os.path.join(output_dir, f'{file_name}_{i+1}.csv')))
-                self.assertTrue(os.path.exists(os.path.join(output_dir, f'{file_name}_{i+1}.txt')))
-                self.assertTrue(os.path.exists(os.path.join(output_dir, f'{file_name}_{i+1}.xlsx')))
-
-                # # Verify file contents
-                self.verify_csv_content(os.path.join(output_dir, f'{file_name}_{i+1}.csv'), data)
-                self.verify_txt_content(os.path.join(output_dir, f'{file_name}_{i+1}.txt'), data)
-                self.verify_excel_content(os.path.join(output_dir, f'{file_name}_{i+1}.xlsx'), data)
+                # Verify file contents; each verifier's open raises FileNotFoundError for a missing file
+                expected = self.normalize_expected(data)
+                base = os.path.join(output_dir, f'{file_name}_{i+1}')
+                for ext, verify in self.get_verifiers():
+                    verify(f'{base}.{ext}', expected[ext])
 
     def verify_files(self,data, db_type, fetch_type):
         """Helper method to save data and verify CSV, TXT, Excel files."""
-        output_dir = './Test/TestFiles'
+        output_dir = self.files_dir
 
-        # Check if files exist
-        self.assertTrue(os.path.exists(os.path.join(output_dir, f'{db_type}_{fetch_type}_test_1.csv')))
-        self.assertTrue(os.path.exists(os.path.join(output_dir, f'{db_type}_{fetch_type}_test_1.txt')))
-        self.assertTrue(os.path.exists(os.path.join(output_dir, f'{db_type}_{fetch_type}_test_1.xlsx')))
-
-        # Verify file contents
-        self.verify_csv_content(os.path.join(output_dir, f'{db_type}_{fetch_type}_test_1.csv'), data)
-        self.verify_txt_content(os.path.join(output_dir, f'{db_type}_{fetch_type}_test_1.txt'), data)
-        self.verify_excel_content(os.path.join(output_dir, f'{db_type}_{fetch_type}_test_1.xlsx'), data)
+        # Verify file contents; each verifier's open raises FileNotFoundError for a missing file
+        expected = self.normalize_expected(data)
+        base = os.path.join(output_dir, f'{db_type}_{fetch_type}_test_1')
+        for ext, verify in self.get_verifiers():
+            verify(f'{base}.{ext}', expected[ext])
 
     # Verification methods...
-    def verify_csv_content(self, file_path, expected_data):
-        """Verify the content of the CSV file."""
-        with open(file_path, mode='r', encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-            rows = list(reader)
-            self.assertEqual(len(rows), len(expected_data))
-            for i, row in enumerate(rows):
-                for key, value in row.items():
-                    self.assertEqual(str(value), str(expected_data[i][key]) if  str(expected_data[i][key]) != 'None' else '')
-
-    def verify_txt_content(self, file_path, expected_data):
-        """Verify the content of the TXT file."""
-        with open(file_path, mode='r', encoding="utf-8") as file:
-            lines = file.readlines()
-            self.assertEqual(len(lines) - 1, len(expected_data))  # -1 for the header
-            headers = lines[0].strip().split('\t')
-            for i, line in enumerate(lines[1:]):
-                values = line.strip().split('\t')
-                row = dict(zip(headers, values))
-                for key in headers:
-                    self.assertEqual(str(row[key]), str(expected_data[i][key]))
-
-    def verify_excel_content(self, file_path, expected_data):
-        """Verify the content of the Excel file."""
-        workbook = load_workbook(filename=file_path)
-        sheet = workbook.active
-        headers = [cell.value for cell in sheet[1]]
-        for i, row in enumerate(sheet.iter_rows(values_only=True, min_row=2)):
-            row_data = dict(zip(headers, row))
-            for key in headers:
-                self.assertEqual(str(row_data[key]), str(expected_data[i][key]) if  str(expected_data[i][key]) != 'None' else '')
+    def verify_csv_content(self, file_path, expected_str):
+        """Verify the content of the CSV file against rows normalized by normalize_expected."""
+        with open(file_path, mode='r', encoding="utf-8", newline='', buffering=1 << 20) as file:
+            reader = csv.reader(file)
+            headers = next(reader)
+            # Materialize each expected row in header order once, so every data row is one list compare
+            expected_rows = [[row[key] for key in headers] for row in expected_str]
+            row_count = 0
+            for i, row in enumerate(reader):
+                self.assertLess(i, len(expected_rows))
+                self.assertEqual(row, expected_rows[i])
+                row_count = i + 1
+            self.assertEqual(row_count, len(expected_rows))
+
+    def verify_txt_content(self, file_path, expected_str):
+        """Verify the content of the TXT file against rows normalized by normalize_expected."""
+        with open(file_path, mode='r', encoding="utf-8", buffering=1 << 20) as file:
+            headers = next(file).strip().split('\t')
+            # Materialize each expected row in header order once, so every data row is one list compare
+            expected_rows = [[row[key] for key in headers] for row in expected_str]
+            row_count = 0
+            for i, line in enumerate(file):
+                self.assertLess(i, len(expected_rows))
+                self.assertEqual(line.strip().split('\t'), expected_rows[i])
+                row_count = i + 1
+            self.assertEqual(row_count, len(expected_rows))
+
+    def verify_excel_content(self, file_path, expected_str):
+        """Verify the content of the Excel file against rows normalized by normalize_expected."""
+        workbook = load_workbook(filename=file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.active
+            headers = [cell.value for cell in sheet[1]]
+            # Materialize each expected row in header order once, so every data row is one list compare
+            expected_rows = [[row[key] for key in headers] for row in expected_str]
+            for i, row in enumerate(sheet.iter_rows(values_only=True, min_row=2)):
+                self.assertEqual([str(value) for value in row], expected_rows[i])
+        finally:
+            # Read-only workbooks keep the underlying zip handle open until closed.
+            workbook.close()
 
     @classmethod
     def load_config(cls):
-        """Load the configuration settings from TestConfig.ini."""
-        config = configparser.ConfigParser()
-        config.read('./Configs/Test_Config.ini')
-        return config
+        """Load the configuration settings from TestConfig.ini, parsing the file only once per run."""
+        if getattr(cls, '_config', None) is None:
+            config = configparser.ConfigParser()
+            config.read('./Configs/Test_Config.ini')
+            cls._config = config
+        return cls._config
     
     # Deleting all the testfiles and close connections
     @classmethod
@@ -478,29 +518,25 @@ class TestSQLExecutorIntegration(unittest.TestCase):
         for db_type, db in cls.databases.items():
             try:
                 with db.transaction():
+                    # Leave the schema in place for the next run; setUpClass truncates and reseeds it.
                     if db_type == 'oracle':
-                        db.execute_query("DROP TABLE TestActors CASCADE CONSTRAINTS")
+                        db.execute_query("TRUNCATE TABLE TestActors")
                     elif db_type == 'postgres':
-                        db.execute_query("DROP TABLE IF EXISTS TestActors CASCADE")
-                    cls.logger.info(f"{db_type} test table dropped.")
+                        db.execute_query("TRUNCATE TABLE TestActors RESTART IDENTITY CASCADE")
+                    cls.logger.info(f"{db_type} test table truncated.")
             except Exception as e:
                 cls.logger.error(f"Error dropping {db_type} table: {e}")
 
         # Decide whether to clean up files based on config
         if config.getboolean('TestSettings', 'CleanUpFiles'):
-            output_dir = './Test/TestFiles/'
-            sqlFiles_dir = './Test/SQL Files'
-            testScripts_dir = './Test/TestScripts'
             try:
-                if os.path.exists(output_dir):
-                    shutil.rmtree(output_dir)
-                if os.path.exists(sqlFiles_dir):
-                    shutil.rmtree(sqlFiles_dir)
-                if os.path.exists(testScripts_dir):
-                    shutil.rmtree(testScripts_dir)
+                # ignore_errors skips the per-path exists pre-check (which races with rmtree anyway)
+                shutil.rmtree(cls.temp_root, ignore_errors=True)
                 cls.logger.info("Test directories and files cleaned up.")
             except Exception as e:
                 cls.logger.error(f"Error during test cleanup: {e}")
+        else:
+            cls.logger.info(f"Test files kept at {cls.temp_root}.")
 
 if __name__ == '__main__':
     unittest.main()